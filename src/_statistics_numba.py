@@ -0,0 +1,121 @@
+"""Numba-compiled kernels backing the large-array path of StatisticsUtils.
+
+Importing this module requires :mod:`numba`. :mod:`src.statistics_utils`
+only imports it lazily, for long one-dimensional inputs, and falls back
+to the NumPy implementation when Numba is not installed.
+
+The kernels receive plain ``float64`` arrays and scalars only, and leave
+input validation (and the error messages) to :class:`StatisticsUtils`.
+The z-score and min-max kernels use fastmath flags that allow
+reassociation and fused multiply-add so that the loops vectorize, without
+assuming the data is free of NaN or inf. The moving average keeps strict
+IEEE semantics because its running sum relies on compensated summation.
+"""
+
+import numpy as np
+from numba import njit
+
+_FASTMATH = {"reassoc", "contract"}
+
+
+@njit(cache=True)
+def _neumaier_add(total, comp, x):
+    """Add ``x`` to the compensated sum ``(total, comp)`` and return it."""
+    t = total + x
+    if abs(total) >= abs(x):
+        comp += (total - t) + x
+    else:
+        comp += (x - t) + total
+    return t, comp
+
+
+@njit(cache=True)
+def _window_sum(a, start, stop):
+    """Return the compensated sum ``(total, comp)`` of ``a[start:stop]``."""
+    total = 0.0
+    comp = 0.0
+    for i in range(start, stop):
+        total, comp = _neumaier_add(total, comp, a[i])
+    return total, comp
+
+
+@njit(cache=True)
+def _window_mean(total, comp, w):
+    """Return the mean of a window from its compensated sum."""
+    if np.isfinite(total):
+        return (total + comp) / w
+    # The compensation term is meaningless (often NaN) for a non-finite sum.
+    return total / w
+
+
+@njit(cache=True)
+def _moving_average_nb(a, w):
+    """Return the moving average of ``a`` with a running window sum.
+
+    The running sum uses Neumaier compensation so that a large value
+    leaving the window does not corrupt the following outputs. It is
+    compiled without fastmath, which would reassociate the compensation
+    away. Once the sum becomes non-finite (NaN, inf or overflow) it can
+    no longer be updated incrementally, so each window is summed directly
+    until the sum is finite again.
+    """
+    n = a.size
+    out = np.empty(n - w + 1)
+    total, comp = _window_sum(a, 0, w)
+    out[0] = _window_mean(total, comp, w)
+    for i in range(w, n):
+        if np.isfinite(total):
+            total, comp = _neumaier_add(total, comp, a[i])
+            total, comp = _neumaier_add(total, comp, -a[i - w])
+        else:
+            total, comp = _window_sum(a, i - w + 1, i + 1)
+        out[i - w + 1] = _window_mean(total, comp, w)
+    return out
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _zscore_nb(a):
+    """Return ``(z, std)``; ``z`` is only scaled when ``std`` is non-zero."""
+    n = a.size
+    mean = 0.0
+    for i in range(n):
+        mean += a[i]
+    mean /= n
+
+    out = np.empty(n)
+    sq = 0.0
+    for i in range(n):
+        d = a[i] - mean
+        out[i] = d
+        sq += d * d
+    std = np.sqrt(sq / n)
+
+    if std != 0.0:
+        inv = 1.0 / std
+        for i in range(n):
+            out[i] *= inv
+    return out, std
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _minmax_nb(a):
+    """Return ``(scaled, min, max)``; ``scaled`` is only valid if they differ."""
+    n = a.size
+    lo = a[0]
+    hi = a[0]
+    for i in range(n):
+        x = a[i]
+        if np.isnan(x):
+            lo = hi = np.nan
+            break
+        if x < lo:
+            lo = x
+        elif x > hi:
+            hi = x
+
+    out = np.empty(n)
+    if lo != hi:
+        rng = hi - lo
+        for i in range(n):
+            out[i] = (a[i] - lo) / rng
+    return out, lo, hi
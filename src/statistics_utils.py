@@ -5,9 +5,32 @@ do not depend on machine learning models. They are designed to be simple
 enough for unit testing while still reflecting real-world needs.
 """
 
-from typing import Sequence
+from functools import lru_cache
+from types import ModuleType
+from typing import Optional, Sequence
 import numpy as np
 
+# Inputs at least this long are handed to the Numba kernels when Numba is
+# installed; below it the JIT dispatch costs more than it saves.
+NUMBA_MIN_SIZE = 10_000
+
+
+@lru_cache(maxsize=None)
+def _numba_kernels() -> Optional[ModuleType]:
+    """Import the compiled kernels on first use, or return ``None``."""
+    try:
+        from . import _statistics_numba
+    except ImportError:
+        return None
+    return _statistics_numba
+
+
+def _use_numba(arr: np.ndarray) -> Optional[ModuleType]:
+    """Return the kernels module if the 1D ``arr`` should take the Numba path."""
+    if arr.size < NUMBA_MIN_SIZE:
+        return None
+    return _numba_kernels()
+
 
 class StatisticsUtils:
     """Collection of basic statistical helper functions.
@@ -16,8 +39,28 @@ class StatisticsUtils:
     All methods validate their inputs and raise clear exceptions when
     the arguments are invalid, so that tests can verify both normal and
     error behaviour.
+
+    One-dimensional inputs with at least :data:`NUMBA_MIN_SIZE` elements
+    are processed by Numba-compiled kernels when :mod:`numba` is
+    installed; otherwise the NumPy implementation is used.
     """
 
+    @staticmethod
+    def _as_1d(arr: Sequence[float], name: str) -> np.ndarray:
+        """Convert ``arr`` to a contiguous 1D ``float64`` array.
+
+        ``name`` is the calling method, used in the error message.
+
+        Raises
+        ------
+        ValueError
+            If ``arr`` is not one-dimensional.
+        """
+        arr = np.asarray(arr, dtype=np.float64)
+        if arr.ndim != 1:
+            raise ValueError(f"{name} only supports 1D sequences")
+        return np.ascontiguousarray(arr)
+
     def moving_average(self, arr: Sequence[float], window: int) -> np.ndarray:
         """Compute a simple moving average over a one-dimensional sequence.
 
@@ -38,20 +81,27 @@ class StatisticsUtils:
         Raises
         ------
         ValueError
-            If ``window`` is not positive or is larger than ``len(arr)``.
+            If ``window`` is not positive or is larger than ``len(arr)``,
+            or if ``arr`` is not one-dimensional.
         """
         if window <= 0:
             raise ValueError("window must be a positive integer")
 
-        arr = np.asarray(arr, dtype=float)
-        if arr.ndim != 1:
-            raise ValueError("moving_average only supports 1D sequences")
+        arr = self._as_1d(arr, "moving_average")
 
         if len(arr) < window:
             raise ValueError("window must not be larger than the array size")
 
-        kernel = np.ones(window, dtype=float) / window
-        return np.convolve(arr, kernel, mode="valid")
+        kernels = _use_numba(arr)
+        if kernels is not None:
+            return kernels._moving_average_nb(arr, window)
+
+        # Sum each window on its own with a ones kernel: a global cumulative
+        # sum would carry the rounding error of every earlier value into
+        # later windows.
+        sums = np.convolve(arr, np.ones(window), mode="valid")
+        np.divide(sums, window, out=sums)
+        return sums
 
     def zscore(self, arr: Sequence[float]) -> np.ndarray:
         """Return the z-score of each value in a numeric sequence.
@@ -68,21 +118,33 @@ class StatisticsUtils:
         Returns
         -------
         z:
-            NumPy array of the same shape as the input sequence,
-            containing the z-score of each element.
+            One-dimensional NumPy array of the same length as the input
+            sequence, containing the z-score of each element.
 
         Raises
         ------
         ValueError
             If the standard deviation of the input is zero, which would
-            lead to a division by zero.
+            lead to a division by zero, or if ``arr`` is not
+            one-dimensional.
         """
-        arr = np.asarray(arr, dtype=float)
-        std = arr.std()
+        arr = self._as_1d(arr, "zscore")
+        kernels = _use_numba(arr)
+        if kernels is not None:
+            out, std = kernels._zscore_nb(arr)
+            if std == 0:
+                raise ValueError("Standard deviation is zero; z-scores are undefined")
+            return out
+
+        out = np.empty_like(arr)
+        np.subtract(arr, arr.mean(), out=out)
+
+        std = np.sqrt(np.dot(out, out) / out.size)
         if std == 0:
             raise ValueError("Standard deviation is zero; z-scores are undefined")
-        mean = arr.mean()
-        return (arr - mean) / std
+
+        np.multiply(out, 1.0 / std, out=out)
+        return out
 
     def min_max_scale(self, arr: Sequence[float]) -> np.ndarray:
         """Scale a numeric sequence to the [0, 1] range.
@@ -105,11 +167,22 @@ class StatisticsUtils:
         ------
         ValueError
             If all values in ``arr`` are equal, making the scaling
-            undefined.
+            undefined, or if ``arr`` is not one-dimensional.
         """
-        arr = np.asarray(arr, dtype=float)
+        arr = self._as_1d(arr, "min_max_scale")
+        kernels = _use_numba(arr)
+        if kernels is not None:
+            out, min_val, max_val = kernels._minmax_nb(arr)
+            if min_val == max_val:
+                raise ValueError("All values are equal; min-max scaling is undefined")
+            return out
+
         min_val = arr.min()
         max_val = arr.max()
         if min_val == max_val:
             raise ValueError("All values are equal; min-max scaling is undefined")
-        return (arr - min_val) / (max_val - min_val)
+
+        out = np.empty_like(arr)
+        np.subtract(arr, min_val, out=out)
+        np.divide(out, max_val - min_val, out=out)
+        return out
@@ -0,0 +1,18 @@
+"""Shared pytest configuration for the test suite.
+
+The tests do not share mutable state, so they can run in parallel. When
+``pytest-xdist`` is installed the suite is distributed over all CPUs by
+default (``-n auto``); pass ``-n 0`` to run it serially.
+"""
+
+import pytest
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    if hasattr(config, "workerinput"):
+        return
+    if config.option.numprocesses is None and not config.option.usepdb:
+        config.option.numprocesses = "auto"
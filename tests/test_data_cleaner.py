@@ -1,3 +1,5 @@
+import functools
+import numpy as np
 import pandas as pd
 import pandas.testing as pdt
 import unittest
@@ -5,11 +7,13 @@ import unittest
 from src.data_cleaner import DataCleaner
 
 
-def make_sample_df() -> pd.DataFrame:
-    """Create a small DataFrame for testing.
+@functools.lru_cache(maxsize=1)
+def _sample_template() -> pd.DataFrame:
+    """Build the shared sample DataFrame once.
 
-    The DataFrame intentionally contains missing values, extra whitespace
-    in a text column, and an obvious numeric outlier.
+    The returned object is cached per process (so each pytest-xdist
+    worker builds its own) and must not be modified; use
+    :func:`make_sample_df` to obtain an independent copy.
     """
     df = pd.DataFrame(
         {
@@ -19,14 +23,29 @@ def make_sample_df() -> pd.DataFrame:
         }
     )
 
-    df["name"] = df["name"].astype(pd.StringDtype()) 
+    # Arrow-backed strings so that ``.str`` methods use PyArrow compute kernels.
+    df["name"] = pd.array(df["name"].to_list(), dtype=pd.StringDtype("pyarrow"))
     
     return df
 
 
+def make_sample_df() -> pd.DataFrame:
+    """Create a small DataFrame for testing.
+
+    The DataFrame intentionally contains missing values, extra whitespace
+    in a text column, and an obvious numeric outlier.
+    """
+    return _sample_template().copy()
+
+
 class TestDataCleaner(unittest.TestCase):
     """Test suite for DataCleaner class."""
 
+    @classmethod
+    def setUpClass(cls):
+        # DataCleaner no guarda estado: todos los tests comparten una instancia.
+        cls.cleaner = DataCleaner()
+
     def test_example_trim_strings_with_pandas_testing(self):
         """Ejemplo de test usando pandas.testing para comparar DataFrames completos.
         
@@ -38,9 +57,8 @@ class TestDataCleaner(unittest.TestCase):
             "name": ["  Alice  ", "  Bob  ", "Carol"],
             "age": [25, 30, 35]
         })
-        cleaner = DataCleaner()
         
-        result = cleaner.trim_strings(df, ["name"])
+        result = self.cleaner.trim_strings(df, ["name"])
         
         # DataFrame esperado después de trim
         expected = pd.DataFrame({
@@ -64,9 +82,8 @@ class TestDataCleaner(unittest.TestCase):
             "age": [25, 30, None],
             "city": ["SCL", "LPZ", "SCL"]
         })
-        cleaner = DataCleaner()
         
-        result = cleaner.drop_invalid_rows(df, ["name"])
+        result = self.cleaner.drop_invalid_rows(df, ["name"])
         
         # Verificar que la columna 'name' ya no tiene valores faltantes
         # Los índices después de drop_invalid_rows son [0, 2] (se eliminó la fila 1)
@@ -79,10 +96,9 @@ class TestDataCleaner(unittest.TestCase):
     def test_drop_invalid_rows_removes_rows_with_missing_values(self):
         """Test que verifica que el método drop_invalid_rows elimina correctamente las filas
         que contienen valores faltantes (NaN o None) en las columnas especificadas."""
-        cleaner = DataCleaner()
         df = make_sample_df()
         
-        result_df = cleaner.drop_invalid_rows(df, ["name", "age"])
+        result_df = self.cleaner.drop_invalid_rows(df, ["name", "age"])
         
         self.assertLess(len(result_df), len(df))
         self.assertEqual(len(result_df), 2)
@@ -92,14 +108,22 @@ class TestDataCleaner(unittest.TestCase):
         
         pdt.assert_index_equal(result_df.index, pd.Index([0, 3]))
 
+    def test_drop_invalid_rows_accepts_generator_of_columns(self):
+        """Test que verifica que drop_invalid_rows acepta cualquier iterable de columnas,
+        incluido un generador que solo puede recorrerse una vez."""
+        df = make_sample_df()
+
+        result_df = self.cleaner.drop_invalid_rows(df, (c for c in ["name", "age"]))
+
+        pdt.assert_index_equal(result_df.index, pd.Index([0, 3]))
+
     def test_drop_invalid_rows_raises_keyerror_for_unknown_column(self):
         """Test que verifica que el método drop_invalid_rows lanza un KeyError cuando
         se llama con una columna que no existe en el DataFrame."""
-        cleaner = DataCleaner()
         df = make_sample_df()
         
         with self.assertRaises(KeyError) as context:
-            cleaner.drop_invalid_rows(df, ["age", "does_not_exist"])
+            self.cleaner.drop_invalid_rows(df, ["age", "does_not_exist"])
             
         self.assertIn("does_not_exist", str(context.exception))
 
@@ -107,12 +131,11 @@ class TestDataCleaner(unittest.TestCase):
         """Test que verifica que el método trim_strings elimina correctamente los espacios
         en blanco al inicio y final de los valores en las columnas especificadas, sin modificar
         el DataFrame original ni las columnas no especificadas."""
-        cleaner = DataCleaner()
         df_original = make_sample_df()
         
         df_copy_for_immutability = df_original.copy()
         
-        result_df = cleaner.trim_strings(df_original, ["name"])
+        result_df = self.cleaner.trim_strings(df_original, ["name"])
         
         self.assertEqual(result_df.loc[0, "name"], "Alice")
         self.assertEqual(result_df.loc[3, "name"], "Carol")
@@ -123,14 +146,26 @@ class TestDataCleaner(unittest.TestCase):
         pdt.assert_series_equal(result_df["city"], df_original["city"], check_names=True)
         self.assertEqual(result_df.loc[0, "city"], "SCL")
 
+    @unittest.skipIf(
+        int(pd.__version__.split(".")[0]) < 3,
+        "solo con copy-on-write (por defecto desde pandas 3.0) se comparten columnas",
+    )
+    def test_trim_strings_does_not_copy_untouched_columns(self):
+        """Test que verifica que trim_strings no copia las columnas que no se recortan:
+        el resultado comparte sus datos con el DataFrame original."""
+        df = make_sample_df()
+
+        result_df = self.cleaner.trim_strings(df, ["name"])
+
+        self.assertTrue(np.shares_memory(result_df["age"].to_numpy(), df["age"].to_numpy()))
+
     def test_trim_strings_raises_typeerror_for_non_string_column(self):
         """Test que verifica que el método trim_strings lanza un TypeError cuando
         se llama con una columna que no es de tipo string."""
-        cleaner = DataCleaner()
         df = make_sample_df()
         
         with self.assertRaises(TypeError) as context:
-            cleaner.trim_strings(df, ["age"])
+            self.cleaner.trim_strings(df, ["age"])
             
         self.assertIn("Columns are not string dtype", str(context.exception))
 
@@ -138,12 +173,11 @@ class TestDataCleaner(unittest.TestCase):
         """Test que verifica que el método remove_outliers_iqr elimina correctamente los
         valores extremos (outliers) de una columna numérica usando el método del rango
         intercuartílico (IQR)."""
-        cleaner = DataCleaner()
         df = make_sample_df() 
         
         df_outlier = pd.DataFrame({'value': [10, 20, 30, 40, 50, 150]})
              
-        result_df = cleaner.remove_outliers_iqr(df_outlier, 'value', factor=1.5)
+        result_df = self.cleaner.remove_outliers_iqr(df_outlier, 'value', factor=1.5)
         
         self.assertNotIn(150, result_df['value'].values)
         
@@ -151,25 +185,35 @@ class TestDataCleaner(unittest.TestCase):
         
         self.assertEqual(len(result_df), 5)
 
+    def test_remove_outliers_iqr_handles_zero_iqr(self):
+        """Test que verifica que remove_outliers_iqr, cuando el IQR es cero, conserva
+        solo las filas iguales al cuartil y devuelve todas si la columna es constante."""
+        df_constant = pd.DataFrame({'value': [7, 7, 7, 7]})
+        df_spike = pd.DataFrame({'value': [7, 7, 7, 7, 7, 100]})
+
+        result_constant = self.cleaner.remove_outliers_iqr(df_constant, 'value')
+        result_spike = self.cleaner.remove_outliers_iqr(df_spike, 'value')
+
+        pdt.assert_frame_equal(result_constant, df_constant)
+        pdt.assert_index_equal(result_spike.index, pd.Index([0, 1, 2, 3, 4]))
+
     def test_remove_outliers_iqr_raises_keyerror_for_missing_column(self):
         """Test que verifica que el método remove_outliers_iqr lanza un KeyError cuando
         se llama con una columna que no existe en el DataFrame."""
-        cleaner = DataCleaner()
         df = make_sample_df()
         
         with self.assertRaises(KeyError) as context:
-            cleaner.remove_outliers_iqr(df, "salary")
+            self.cleaner.remove_outliers_iqr(df, "salary")
             
         self.assertIn("Column 'salary' not found in DataFrame", str(context.exception))
 
     def test_remove_outliers_iqr_raises_typeerror_for_non_numeric_column(self):
         """Test que verifica que el método remove_outliers_iqr lanza un TypeError cuando
         se llama con una columna que no es de tipo numérico."""
-        cleaner = DataCleaner()
         df = make_sample_df()
         
         with self.assertRaises(TypeError) as context:
-            cleaner.remove_outliers_iqr(df, "city")
+            self.cleaner.remove_outliers_iqr(df, "city")
             
         self.assertIn("Column 'city' must be numeric to compute IQR", str(context.exception))
 
@@ -2,29 +2,42 @@ import numpy as np
 import numpy.testing as npt
 import unittest
 
-from src.statistics_utils import StatisticsUtils
+from src.statistics_utils import NUMBA_MIN_SIZE, StatisticsUtils
+
+# Entradas compartidas por los tests parametrizados (se crean una sola vez).
+ARR = np.linspace(1.0, 5.0, 5)
+ARR_TENS = np.linspace(10.0, 50.0, 5)
 
 
 class TestStatisticsUtils(unittest.TestCase):
     """Test suite for StatisticsUtils class."""
 
-    def test_example_moving_average_with_numpy_testing(self):
-        """Ejemplo de test usando numpy.testing para comparar arrays de NumPy.
-        
-        Este test demuestra cómo usar numpy.testing.assert_allclose() para comparar
-        arrays de NumPy con tolerancia para errores de punto flotante, lo cual es
-        esencial cuando trabajamos con operaciones numéricas.
+    @classmethod
+    def setUpClass(cls):
+        # StatisticsUtils no guarda estado: todos los tests comparten una instancia.
+        cls.utils = StatisticsUtils()
+
+    def test_moving_average_parametric(self):
+        """Test parametrizado que verifica moving_average para varias entradas y ventanas.
+
+        Cada caso se ejecuta en su propio subTest, de modo que un fallo indica qué
+        combinación de entrada y ventana lo produjo. Se usa numpy.testing.assert_allclose()
+        para comparar arrays de NumPy con tolerancia para errores de punto flotante.
         """
-        utils = StatisticsUtils()
-        arr = [1.0, 2.0, 3.0, 4.0, 5.0]
-        result = utils.moving_average(arr, window=3)
-        
-        # Valores esperados para media móvil con window=3
-        expected = np.array([2.0, 3.0, 4.0])
-        
-        # Usar numpy.testing.assert_allclose() para comparar arrays de NumPy
-        # Esto maneja correctamente errores de punto flotante con tolerancia
-        npt.assert_allclose(result, expected, rtol=1e-7, atol=1e-7)
+        cases = [
+            (ARR, 3, [2.0, 3.0, 4.0]),
+            (ARR, 5, [3.0]),
+            (ARR, 1, ARR),
+            (ARR_TENS, 3, [20.0, 30.0, 40.0]),
+            # Entrada como lista de Python, que también debe aceptarse
+            ([10.0, 20.0, 30.0, 40.0, 50.0], 3, [20.0, 30.0, 40.0]),
+        ]
+        for arr, window, expected in cases:
+            with self.subTest(arr=np.asarray(arr).tolist(), window=window):
+                result = self.utils.moving_average(arr, window=window)
+
+                npt.assert_allclose(result, expected, rtol=1e-7, atol=1e-7)
+                self.assertEqual(result.shape, (len(arr) - window + 1,))
 
     def test_example_min_max_scale_with_numpy_testing(self):
         """Ejemplo de test usando numpy.testing para verificar transformaciones numéricas.
@@ -33,9 +46,8 @@ class TestStatisticsUtils(unittest.TestCase):
         que una transformación numérica produce los resultados correctos en todo el array,
         considerando errores de punto flotante en cálculos matemáticos.
         """
-        utils = StatisticsUtils()
-        arr = [10.0, 20.0, 30.0, 40.0]
-        result = utils.min_max_scale(arr)
+        arr = np.linspace(10.0, 40.0, 4)
+        result = self.utils.min_max_scale(arr)
         
         # Valores esperados después de min-max scaling: (x - min) / (max - min)
         # min=10, max=40, range=30
@@ -46,79 +58,90 @@ class TestStatisticsUtils(unittest.TestCase):
         # La tolerancia relativa y absoluta permite errores pequeños de punto flotante
         npt.assert_allclose(result, expected, rtol=1e-10, atol=1e-10)
 
-    def test_moving_average_basic_case(self):
-        """Test que verifica que el método moving_average calcula correctamente la media móvil
-        de una secuencia numérica para un caso básico."""
-        utils = StatisticsUtils()
-        arr = [10.0, 20.0, 30.0, 40.0, 50.0]
-        window = 3
-        
-        expected = np.array([20.0, 30.0, 40.0])
-        result = utils.moving_average(arr, window=window)
-        
-        npt.assert_allclose(result, expected, rtol=1e-7, atol=1e-7)
-        self.assertEqual(result.shape, expected.shape)
+    def test_moving_average_is_not_affected_by_earlier_large_values(self):
+        """Test que verifica que un valor muy grande al inicio no degrada la precisión
+        de las medias móviles de ventanas posteriores que no lo contienen."""
+        arr = [1e16] + [1.0] * 20
+
+        result = self.utils.moving_average(arr, window=3)
+
+        npt.assert_array_equal(result[-3:], [1.0, 1.0, 1.0])
 
     def test_moving_average_raises_for_invalid_window(self):
         """Test que verifica que el método moving_average lanza un ValueError cuando
         se proporciona una ventana (window) inválida."""
-        utils = StatisticsUtils()
         arr = [1, 2, 3]
         
         # Caso 1: window=0 (valor no positivo)
         with self.assertRaises(ValueError) as context:
-            utils.moving_average(arr, window=0)
+            self.utils.moving_average(arr, window=0)
         self.assertIn("window must be a positive integer", str(context.exception))
         
         # Caso2: window mayor que la longitud del array
         with self.assertRaises(ValueError) as context:
-            utils.moving_average(arr, window=4)
+            self.utils.moving_average(arr, window=4)
         self.assertIn("window must not be larger than the array size", str(context.exception))
 
     def test_moving_average_only_accepts_1d_sequences(self):
         """Test que verifica que el método moving_average lanza un ValueError cuando
         se llama con una secuencia multidimensional."""
-        utils = StatisticsUtils()
         arr_2d = [[1, 2], [3, 4]]
         
         with self.assertRaises(ValueError) as context:
-            utils.moving_average(arr_2d, window=2)
+            self.utils.moving_average(arr_2d, window=2)
             
         self.assertIn("moving_average only supports 1D sequences", str(context.exception))
 
+        # Un escalar (0D) tampoco es una secuencia 1D
+        with self.assertRaises(ValueError) as context:
+            self.utils.moving_average(5.0, window=1)
+
+        self.assertIn("moving_average only supports 1D sequences", str(context.exception))
+
+    def test_zscore_and_min_max_scale_only_accept_1d_sequences(self):
+        """Test que verifica que zscore y min_max_scale lanzan un ValueError cuando
+        se llaman con una secuencia multidimensional."""
+        arr_2d = [[1, 2], [3, 4]]
+
+        with self.assertRaises(ValueError) as context:
+            self.utils.zscore(arr_2d)
+        self.assertIn("zscore only supports 1D sequences", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            self.utils.min_max_scale(arr_2d)
+        self.assertIn("min_max_scale only supports 1D sequences", str(context.exception))
+
     def test_zscore_has_mean_zero_and_unit_std(self):
         """Test que verifica que el método zscore calcula correctamente los z-scores
         de una secuencia numérica, comprobando que el resultado tiene media cero y
         desviación estándar unitaria."""
-        utils = StatisticsUtils()
-        arr = [10.0, 20.0, 30.0, 40.0, 50.0]
+        arr = np.linspace(10.0, 50.0, 5)
         
-        z_scores = utils.zscore(arr)
+        z_scores = self.utils.zscore(arr)
         
-        self.assertAlmostEqual(z_scores.mean(), 0.0, places=7)
-        self.assertAlmostEqual(z_scores.std(ddof=0), 1.0, places=7)
+        # media 0 <=> suma 0, y std (ddof=0) 1 <=> z·z = n
+        npt.assert_allclose(z_scores.sum(), 0.0, atol=1e-7)
+        npt.assert_allclose(float(z_scores @ z_scores), float(len(z_scores)), rtol=1e-7)
 
     def test_zscore_raises_for_zero_std(self):
         """Test que verifica que el método zscore lanza un ValueError cuando
         se llama con una secuencia que tiene desviación estándar cero
         (todos los valores son iguales)."""
-        utils = StatisticsUtils()
         arr_constant = [5, 5, 5, 5]
         
         with self.assertRaises(ValueError) as context:
-            utils.zscore(arr_constant)
+            self.utils.zscore(arr_constant)
             
         self.assertIn("Standard deviation is zero; z-scores are undefined", str(context.exception))
 
     def test_min_max_scale_maps_to_zero_one_range(self):
         """Test que verifica que el método min_max_scale escala correctamente una secuencia
         numérica al rango [0, 1], donde el valor mínimo se mapea a 0 y el máximo a 1."""
-        utils = StatisticsUtils()
-        arr = [2.0, 4.0, 6.0, 8.0]
+        arr = np.arange(2.0, 9.0, 2.0)
 
         expected = np.array([0.0, 1/3, 2/3, 1.0])
         
-        scaled_arr = utils.min_max_scale(arr)
+        scaled_arr = self.utils.min_max_scale(arr)
         
         npt.assert_allclose(scaled_arr, expected, rtol=1e-7, atol=1e-7)
 
@@ -126,17 +149,76 @@ class TestStatisticsUtils(unittest.TestCase):
         
         self.assertAlmostEqual(scaled_arr.max(), 1.0, places=7)
 
+    def test_min_max_scale_maps_extremes_exactly(self):
+        """Test que verifica que min_max_scale asigna exactamente 0.0 al mínimo y 1.0
+        al máximo, también para rangos donde 1 / (max - min) no es exacto."""
+        arr_large = np.zeros(NUMBA_MIN_SIZE)
+        arr_large[-1] = 49.0
+
+        for arr in ([0.0, 49.0], arr_large):
+            with self.subTest(size=len(arr)):
+                scaled_arr = self.utils.min_max_scale(arr)
+
+                self.assertEqual(scaled_arr.min(), 0.0)
+                self.assertEqual(scaled_arr.max(), 1.0)
+
     def test_min_max_scale_raises_for_constant_values(self):
         """Test que verifica que el método min_max_scale lanza un ValueError cuando
         se llama con una secuencia donde todos los valores son iguales (no hay variación)."""
-        utils = StatisticsUtils()
         arr_constant = [3, 3, 3, 3]
         
         with self.assertRaises(ValueError) as context:
-            utils.min_max_scale(arr_constant)
+            self.utils.min_max_scale(arr_constant)
             
         self.assertIn("All values are equal; min-max scaling is undefined", str(context.exception))
 
+    def test_large_inputs_match_numpy_reference(self):
+        """Test que verifica que los arreglos largos (que usan los kernels de Numba
+        cuando está instalado) producen los mismos resultados que las fórmulas de NumPy."""
+        rng = np.random.default_rng(0)
+        arr = rng.normal(loc=5.0, scale=2.0, size=NUMBA_MIN_SIZE + 1)
+        window = 50
+
+        expected_ma = np.convolve(arr, np.ones(window) / window, mode="valid")
+        npt.assert_allclose(self.utils.moving_average(arr, window=window), expected_ma, rtol=1e-9, atol=1e-9)
+        npt.assert_allclose(self.utils.zscore(arr), (arr - arr.mean()) / arr.std(), rtol=1e-9, atol=1e-9)
+        npt.assert_allclose(
+            self.utils.min_max_scale(arr),
+            (arr - arr.min()) / (arr.max() - arr.min()),
+            rtol=1e-9,
+            atol=1e-9,
+        )
+
+        # Serie con desplazamiento grande y un pico inicial: el pico no debe afectar
+        # a las ventanas posteriores que ya no lo contienen.
+        arr_offset = 1e9 + rng.normal(size=NUMBA_MIN_SIZE + 1)
+        arr_offset[0] = 1e17
+        expected_offset = np.convolve(arr_offset, np.ones(window) / window, mode="valid")
+        npt.assert_allclose(
+            self.utils.moving_average(arr_offset, window=window), expected_offset, rtol=1e-12, atol=0
+        )
+
+        # Valores NaN/inf: solo las ventanas que los contienen deben verse afectadas.
+        arr_nonfinite = rng.normal(size=NUMBA_MIN_SIZE + 1)
+        arr_nonfinite[[5, 3000, 6000]] = [np.nan, np.inf, -np.inf]
+        expected_nonfinite = np.convolve(arr_nonfinite, np.ones(window) / window, mode="valid")
+        npt.assert_allclose(
+            self.utils.moving_average(arr_nonfinite, window=window), expected_nonfinite, rtol=1e-9, atol=1e-9
+        )
+
+    def test_large_inputs_raise_for_degenerate_values(self):
+        """Test que verifica que los arreglos largos constantes lanzan los mismos
+        ValueError que los arreglos pequeños."""
+        arr_constant = np.full(NUMBA_MIN_SIZE, 7.0)
+
+        with self.assertRaises(ValueError) as context:
+            self.utils.zscore(arr_constant)
+        self.assertIn("Standard deviation is zero; z-scores are undefined", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            self.utils.min_max_scale(arr_constant)
+        self.assertIn("All values are equal; min-max scaling is undefined", str(context.exception))
+
 
 if __name__ == "__main__":
     unittest.main()